@@ -1,11 +1,6 @@
 import asyncio
-import sys
-from pathlib import Path
 
-# Add paths for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from framework import AgenticDAG
+from dagent.framework import AgenticDAG
 
 
 async def main():
@@ -22,4 +17,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional and unavailable on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""Dagent: multi-agent orchestration framework for complex query execution."""
+
+from .framework import AgenticDAG, execute_query
+
+__all__ = ['AgenticDAG', 'execute_query']
\ No newline at end of file
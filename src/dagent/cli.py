@@ -0,0 +1,46 @@
+"""Command line entry point: ``dagent 'your query here'`` or ``dagent warmup``."""
+
+import asyncio
+import sys
+
+from dagent.framework import AgenticDAG
+from dagent.kernel import KernelAgent
+
+
+async def main():
+    if len(sys.argv) < 2:
+        print("Usage: dagent 'your query here'\n       dagent warmup")
+        sys.exit(1)
+
+    if sys.argv[1:] == ["warmup"]:
+        # Check credentials and connectivity, e.g. during container startup
+        if await KernelAgent().warmup():
+            print("Model provider is reachable")
+        else:
+            print("Model warmup failed")
+            sys.exit(1)
+        return
+
+    query = " ".join(sys.argv[1:])
+
+    framework = AgenticDAG()
+    result = await framework.execute(query)
+
+    if result["success"]:
+        print("Execution completed successfully!")
+    else:
+        print(f"Execution failed: {result.get('error')}")
+
+
+def main_sync():
+    """Run main() on uvloop where available (console script entry point)."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional and unavailable on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
+if __name__ == "__main__":
+    main_sync()
\ No newline at end of file
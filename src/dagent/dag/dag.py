@@ -0,0 +1,378 @@
+from typing import Deque, Dict, FrozenSet, List, Set, Optional, Literal, Tuple
+from dataclasses import dataclass
+from collections import deque
+import asyncio
+import sys
+
+# Shared tuple for each distinct tool allowlist, so nodes with the same tools share one object
+_TOOL_ALLOWLISTS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class DAGNode:
+    """Represents a single node in the execution DAG. Nodes are immutable once built."""
+    id: str
+    task_description: str
+    node_type: Literal["SINGLE_AGENT", "AGENT_TEAM"] = "SINGLE_AGENT"
+
+    # Single agent fields
+    agent_profile: Optional[str] = None
+    generated_system_prompt: Optional[str] = None
+    tool_allowlist: Optional[Tuple[str, ...]] = None
+
+    # Team fields
+    team_config: Optional[Dict] = None
+
+    dependencies: Tuple[str, ...] = ()
+    max_retries: int = 2
+    needs_validation: bool = True
+
+    def __post_init__(self):
+        # Store dependencies as an immutable, duplicate-free tuple of strings that keeps
+        # the planner's order for prompts (frozen, so bypass __setattr__).
+        # IDs, node types and tool names repeat across nodes and plans, so intern them.
+        object.__setattr__(self, "id", sys.intern(str(self.id)))
+        object.__setattr__(self, "dependencies", tuple(dict.fromkeys(sys.intern(str(dep)) for dep in self.dependencies)))
+        object.__setattr__(self, "node_type", sys.intern(self.node_type))
+        if isinstance(self.agent_profile, str):
+            object.__setattr__(self, "agent_profile", sys.intern(self.agent_profile))
+        if self.tool_allowlist is not None:
+            tools = tuple(sys.intern(tool) for tool in self.tool_allowlist)
+            object.__setattr__(self, "tool_allowlist", _TOOL_ALLOWLISTS.setdefault(tools, tools))
+
+
+class DAG:
+    """Directed Acyclic Graph for task execution planning."""
+    
+    def __init__(self):
+        self.nodes: Dict[str, DAGNode] = {}
+        # Reverse adjacency (node ID -> IDs of its direct dependents) and number of
+        # dependencies per node, maintained incrementally by add_node()
+        self.dependents: Dict[str, List[str]] = {}
+        self.indegree: Dict[str, int] = {}
+        # Kahn-style scheduling state, see reset_schedule()
+        self.ready: Deque[str] = deque()
+        self._pending: Dict[str, int] = {}
+        self._requeues: Dict[str, int] = {}
+        self._completed_count = 0
+        self._roots: Optional[List[str]] = None
+        self._final_nodes: Optional[FrozenSet[str]] = None
+        self._topo_levels: Optional[List[List[str]]] = None
+        self._critical_path_lengths: Optional[Dict[str, int]] = None
+    
+    def add_node(self, node: DAGNode) -> None:
+        """Add a node to the DAG."""
+        previous = self.nodes.get(node.id)
+        if previous is not None:
+            for dep in previous.dependencies:
+                self.dependents[dep].remove(node.id)
+
+        self.nodes[node.id] = node
+        self.dependents.setdefault(node.id, [])
+        # Dependencies may reference nodes that are added later
+        for dep in node.dependencies:
+            self.dependents.setdefault(dep, []).append(node.id)
+        self.indegree[node.id] = len(node.dependencies)
+
+        self._roots = None
+        self._final_nodes = None
+        self._topo_levels = None
+        self._critical_path_lengths = None
+    
+    def roots(self) -> List[str]:
+        """Get the IDs of nodes without dependencies (cached until the next add_node())."""
+        if self._roots is None:
+            self._roots = [node_id for node_id, count in self.indegree.items() if count == 0]
+        return self._roots
+    
+    def topo_levels(self) -> List[List[str]]:
+        """
+        Get the node IDs grouped into topological levels.
+        
+        Level 0 holds the nodes without dependencies and every later level holds
+        the nodes whose dependencies all sit in earlier levels, i.e. the rounds
+        of a fully parallel execution. Computed once with Kahn's algorithm in
+        O(V+E) and reused until the next add_node(). Nodes on a cycle are left out.
+        """
+        if self._topo_levels is None:
+            indegree = {
+                node.id: sum(1 for dep in node.dependencies if dep in self.nodes)
+                for node in self.nodes.values()
+            }
+
+            levels = []
+            current = [node_id for node_id, count in indegree.items() if count == 0]
+            while current:
+                levels.append(current)
+                next_level = []
+                for node_id in current:
+                    for child in self.dependents[node_id]:
+                        indegree[child] -= 1
+                        if indegree[child] == 0:
+                            next_level.append(child)
+                current = next_level
+            self._topo_levels = levels
+        return self._topo_levels
+    
+    def critical_path_lengths(self) -> Dict[str, int]:
+        """
+        Get the number of nodes on the longest path from each node to a final node.
+        
+        Starting nodes with the longest remaining chain first keeps the critical
+        path moving when only some ready nodes can run at once. Computed once from
+        the topological levels in O(V+E) and reused until the next add_node().
+        """
+        if self._critical_path_lengths is None:
+            lengths: Dict[str, int] = {}
+            # Dependents always sit in later levels, so walk the levels backwards
+            for level in reversed(self.topo_levels()):
+                for node_id in level:
+                    lengths[node_id] = 1 + max((lengths[child] for child in self.dependents[node_id]), default=0)
+            self._critical_path_lengths = lengths
+        return self._critical_path_lengths
+    
+    def reset_schedule(self) -> None:
+        """Start a new execution: every node is pending and the root nodes are ready."""
+        self._pending = dict(self.indegree)
+        self._requeues = {}
+        self._completed_count = 0
+        self.ready = deque(self.roots())
+
+    def pop_ready(self) -> List[str]:
+        """
+        Take all node IDs that are currently ready to execute.
+
+        Returns:
+            List of ready node IDs; the ready queue is left empty
+        """
+        ready = list(self.ready)
+        self.ready.clear()
+        return ready
+
+    def requeue(self, node_id: str) -> bool:
+        """
+        Schedule a node whose run failed again, at most max_retries times per execution.
+
+        Args:
+            node_id: ID of the failed node
+
+        Returns:
+            True if the node was queued again, False once its retries are used up
+        """
+        requeues = self._requeues.get(node_id, 0)
+        if requeues >= self.nodes[node_id].max_retries:
+            return False
+        self._requeues[node_id] = requeues + 1
+        self.ready.append(node_id)
+        return True
+
+    def mark_completed(self, node_id: str) -> None:
+        """
+        Mark a node as completed, queueing dependents whose dependencies are now all met.
+
+        Args:
+            node_id: ID of the completed node
+        """
+        self._completed_count += 1
+        for dependent in self.dependents[node_id]:
+            self._pending[dependent] -= 1
+            if self._pending[dependent] == 0:
+                self.ready.append(dependent)
+
+    def is_complete(self, completed: Optional[Set[str]] = None) -> bool:
+        """
+        Check if all nodes in the DAG have been completed.
+
+        Args:
+            completed: Set of completed node IDs; defaults to the nodes passed
+                to mark_completed() since the last reset_schedule()
+        """
+        if completed is None:
+            return self._completed_count == len(self.nodes)
+        return len(completed) == len(self.nodes)
+
+    def get_final_nodes(self) -> FrozenSet[str]:
+        """Get nodes that have no dependents (leaf nodes), cached until the next add_node()."""
+        if self._final_nodes is None:
+            self._final_nodes = frozenset(node_id for node_id in self.nodes if not self.dependents[node_id])
+        return self._final_nodes
+      
+    def validate(self) -> tuple[bool, List[str]]:
+        """
+        Validate the DAG for structural integrity.
+        
+        Returns:
+            (is_valid, list_of_errors)
+        """
+        errors = []
+        
+        # Count in-DAG dependencies per node, reporting missing ones in the same pass
+        indegree = {}
+        for node in self.nodes.values():
+            count = 0
+            for dep in node.dependencies:
+                if dep in self.nodes:
+                    count += 1
+                else:
+                    errors.append(f"Node '{node.id}' has missing dependency '{dep}'")
+            indegree[node.id] = count
+        
+        # Kahn's algorithm: any node never reaching indegree 0 sits on or behind a cycle
+        queue = deque(node_id for node_id, count in indegree.items() if count == 0)
+        processed = 0
+        while queue:
+            node_id = queue.popleft()
+            processed += 1
+            for dependent in self.dependents[node_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        
+        if processed != len(self.nodes):
+            errors.append("DAG contains circular dependencies")
+        
+        return len(errors) == 0, errors
+
+
+def _record_from_obj(subtask_data):
+    """Extract node data from a SubtaskNode object"""
+    return {
+        'task_description': subtask_data.task_description,
+        'node_type': getattr(subtask_data, 'node_type', 'SINGLE_AGENT'),
+        'agent_profile': subtask_data.agent_profile,
+        'tool_allowlist': subtask_data.tool_allowlist,
+        'team_config': getattr(subtask_data, 'team_config', None),
+        'dependencies': subtask_data.dependencies or []
+    }
+
+
+def _record_from_dict(subtask_data):
+    """Extract node data from a subtask dict, filling in defaults"""
+    return {
+        'task_description': subtask_data['task_description'],
+        'node_type': subtask_data.get('node_type', 'SINGLE_AGENT'),
+        'agent_profile': subtask_data.get('agent_profile'),
+        'tool_allowlist': subtask_data.get('tool_allowlist'),
+        'team_config': subtask_data.get('team_config'),
+        'dependencies': subtask_data.get('dependencies', [])
+    }
+
+
+def _start_eager_task(coro) -> asyncio.Task:
+    """
+    Start a task, eagerly where supported (Python 3.12+).
+
+    An eager task runs its coroutine up to the first suspension point inside this
+    call, so a profile served from the in-memory cache completes without a trip
+    through the event loop. Only the task started here is eager; the loop's task
+    factory is left untouched.
+    """
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.ensure_future(coro)
+
+
+async def build_dag_from_plan(plan) -> DAG:
+    """
+    Build a DAG from planner output (Plan object or dict) with batched, parallel profile generation.
+
+    Args:
+        plan: Plan object from planner or dict with 'subtasks' key
+
+    Returns:
+        DAG object ready for execution with pre-generated system prompts
+    """
+    dag = DAG()
+
+    # Handle both Plan object and dict formats
+    if hasattr(plan, 'subtasks'):
+        subtasks = plan.subtasks
+    elif isinstance(plan, dict) and 'subtasks' in plan:
+        subtasks = plan['subtasks']
+    else:
+        raise ValueError("Invalid plan format: missing 'subtasks'")
+
+    # Initialize profile generator
+    from dagent.kernel.profiles import ProfileGenerator
+    profile_generator = ProfileGenerator()
+
+    # Subtasks of a plan share one format, so detect it once up front
+    first_subtask = next(iter(subtasks.values()), None)
+    as_record = _record_from_obj if hasattr(first_subtask, 'task_description') else _record_from_dict
+
+    # Start profile generation for both single agent and team nodes in a single
+    # pass. Single agent profiles are marshaled into batched LLM calls, team
+    # profiles run individually. Every outstanding profile call is cancelled as
+    # soon as one of them fails.
+    records = {}
+    team_profile_tasks = {}
+    single_agent_specs = {}
+    single_agent_profiles = None
+    profile_tasks: List[asyncio.Task] = []
+    try:
+        for task_id, subtask_data in subtasks.items():
+            data = as_record(subtask_data)
+            records[task_id] = data
+
+            if data['node_type'] == 'SINGLE_AGENT':
+                single_agent_specs[task_id] = {
+                    'agent_profile': data['agent_profile'],
+                    'task_description': data['task_description'],
+                    'tools': data['tool_allowlist'],
+                    'dependencies': data['dependencies']
+                }
+            elif data['node_type'] == 'AGENT_TEAM':
+                team_profile_tasks[task_id] = _start_eager_task(
+                    profile_generator.generate_team_profile(
+                        data['task_description'],
+                        data['team_config']
+                    )
+                )
+                profile_tasks.append(team_profile_tasks[task_id])
+
+        if single_agent_specs:
+            single_agent_profiles = _start_eager_task(
+                profile_generator.generate_profiles_batched(single_agent_specs)
+            )
+            profile_tasks.append(single_agent_profiles)
+
+        if profile_tasks:
+            done, _ = await asyncio.wait(profile_tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()  # Re-raise the first failure
+    finally:
+        for task in profile_tasks:
+            task.cancel()
+        await asyncio.gather(*profile_tasks, return_exceptions=True)
+
+    # Create DAG nodes from the generated profiles
+    for task_id, data in records.items():
+        if data['node_type'] == 'AGENT_TEAM':
+            # Team node with generated prompt
+            node = DAGNode(
+                id=task_id,
+                task_description=data['task_description'],
+                node_type="AGENT_TEAM",
+                team_config=data['team_config'],
+                generated_system_prompt=team_profile_tasks[task_id].result(),
+                dependencies=data['dependencies']
+            )
+        else:
+            # Single agent node
+            node = DAGNode(
+                id=task_id,
+                task_description=data['task_description'],
+                node_type="SINGLE_AGENT",
+                agent_profile=data['agent_profile'],
+                generated_system_prompt=single_agent_profiles.result()[task_id],
+                tool_allowlist=data['tool_allowlist'],
+                dependencies=data['dependencies']
+            )
+        dag.add_node(node)
+
+    # Validate the constructed DAG
+    is_valid, errors = dag.validate()
+    if not is_valid:
+        raise ValueError(f"Invalid DAG structure: {'; '.join(errors)}")
+
+    return dag
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Simple framework entry point for Agentic DAG execution.
+Wraps the existing main.py logic in a clean API.
+"""
+
+from typing import Dict, Any
+from pathlib import Path
+import asyncio
+import orjson
+
+from dagent.planner import Planner, Plan
+from dagent.planner.planner import SubtaskNode, AgentProfile
+from dagent.dag import build_dag_from_plan
+from dagent.kernel import WorkflowExecutor
+from dagent.planner.prompts import AVAILABLE_AGENT_PROFILES, AVAILABLE_TOOLS
+from dagent.utils import cache_enabled, cache_key, cache_get, cache_put
+
+
+class AgenticDAG:
+    """
+    Main framework class for executing agentic DAG workflows.
+
+    Usage:
+        framework = AgenticDAG()
+        result = await framework.execute("Create a Python hello world script")
+    """
+
+    def __init__(self):
+        """Initialize the Agentic DAG framework."""
+        self.planner = Planner()
+        self.executor = WorkflowExecutor()
+
+    async def execute(self, query: str) -> Dict[str, Any]:
+        """
+        Execute a query using the agentic DAG framework.
+
+        Args:
+            query: The user query to execute
+
+        Returns:
+            Dict with execution results and metadata
+        """
+        try:
+            plan = await self._get_plan(query)
+
+            # Save plan to file while the DAG and its profiles are being built
+            save_task = asyncio.create_task(self._save_plan(query, plan))
+
+            print("Converting to DAG and generating profiles...")
+            try:
+                dag = await build_dag_from_plan(plan)
+            except BaseException:
+                # The build error is the one to report, not a failure of the debug dump
+                save_task.cancel()
+                await asyncio.gather(save_task, return_exceptions=True)
+                raise
+            await save_task
+            print(f"DAG created: {len(dag.nodes)} nodes with pre-generated profiles")
+
+            print("Executing workflow...")
+            results = await self.executor.execute(dag)
+
+            # Show summary
+            successful = sum(1 for r in results.values() if r.success)
+            print(f"Workflow completed: {successful}/{len(results)} tasks successful")
+
+            return {
+                "success": successful == len(results),
+                "query": query,
+                "plan": plan,
+                "dag": dag,
+                "execution_results": results,
+                "summary": {
+                    "total_tasks": len(results),
+                    "successful_tasks": successful,
+                    "failed_tasks": len(results) - successful,
+                }
+            }
+
+        except Exception as e:
+            print(f"Error during execution: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "query": query
+            }
+
+    async def _get_plan(self, query: str) -> Plan:
+        """Create a plan for the query, reusing a cached plan when DAGENT_CACHE=1."""
+        key = None
+        if cache_enabled():
+            key = cache_key(query, self.planner.agent.model.id, AVAILABLE_AGENT_PROFILES, AVAILABLE_TOOLS)
+            cached_plan = await asyncio.to_thread(cache_get, "plans", key)
+            if cached_plan is not None:
+                plan = Plan.model_validate(cached_plan)
+                print(f"Plan loaded from cache: {len(plan.subtasks)} subtasks")
+                return plan
+
+        print("Creating plan...")
+        plan = await self.planner.create_plan(query, AVAILABLE_AGENT_PROFILES, AVAILABLE_TOOLS)
+        print(f"Plan created: {len(plan.subtasks)} subtasks")
+
+        if key is not None:
+            await asyncio.to_thread(cache_put, "plans", key, plan.model_dump())
+        return plan
+
+    async def _save_plan(self, query: str, plan) -> None:
+        """Save the generated plan to file for debugging, serializing and writing off the event loop."""
+        # Subtasks are serialized one at a time by _serialize_plan_object, so no
+        # second copy of the plan is built
+        plan_data = {
+            "query": query,
+            "planning_rationale": plan.planning_rationale,
+            "expected_final_output": plan.expected_final_output,
+            "subtasks": plan.subtasks
+        }
+
+        def write_plan() -> None:
+            Path('generated_plan.json').write_bytes(
+                orjson.dumps(plan_data, default=_serialize_plan_object, option=orjson.OPT_INDENT_2)
+            )
+
+        await asyncio.get_running_loop().run_in_executor(None, write_plan)
+        print("Plan saved to: generated_plan.json")
+
+
+def _serialize_plan_object(obj) -> Dict[str, Any]:
+    """orjson ``default`` hook for the subtask and agent profile models of a plan."""
+    if isinstance(obj, AgentProfile):
+        return {
+            "task_type": obj.task_type,
+            "complexity": obj.complexity,
+            "output_format": obj.output_format,
+            "reasoning_style": obj.reasoning_style
+        }
+
+    if isinstance(obj, SubtaskNode):
+        data = {
+            "task_description": obj.task_description,
+            "dependencies": obj.dependencies
+        }
+
+        if obj.node_type == "AGENT_TEAM":
+            data["node_type"] = "AGENT_TEAM"
+            data["team_config"] = obj.team_config
+        else:
+            data["node_type"] = "SINGLE_AGENT"
+            data["agent_profile"] = obj.agent_profile
+            data["tool_allowlist"] = obj.tool_allowlist or []
+
+        return data
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Convenience function for simple usage
+async def execute_query(query: str) -> Dict[str, Any]:
+    """
+    Simple function to execute a query with default settings.
+
+    Usage:
+        result = await execute_query("Create a hello world Python script")
+    """
+    framework = AgenticDAG()
+    return await framework.execute(query)
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""Judge agent for evaluating task output quality in actor-critic architecture."""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from agno.agent import Agent
+from agno.run.agent import RunContentEvent
+from .prompts import JUDGE_SYSTEM_PROMPT
+
+# Import centralized tracing
+from dagent.utils import get_model
+from dagent.tracing import langfuse, observe
+
+logger = logging.getLogger(__name__)
+
+# Structured fields of the judge response (see JUDGE_SYSTEM_PROMPT)
+_DECISION_ACCEPT_RE = re.compile(r'DECISION\s*:\s*ACCEPT', re.IGNORECASE)
+_FIELD_RE = re.compile(r'^(FEEDBACK|IMPROVEMENT_SUGGESTIONS)\s*:\s*(.*)$', re.IGNORECASE | re.MULTILINE)
+_FEEDBACK_LINE_RE = re.compile(r'^FEEDBACK\s*:.*\n', re.IGNORECASE | re.MULTILINE)
+
+# Upper bound on the streamed judge response kept in memory
+MAX_JUDGE_RESPONSE_CHARS = 16384
+
+# Agent outputs longer than this are shown to the judge as head + tail
+MAX_JUDGE_OUTPUT_CHARS = 32768
+
+_PROMPT_OUTPUT_HEADER = "\n\nAgent Output:\n"
+_PROMPT_SUFFIX = "\n\nEvaluate this output quality using the specified format."
+
+
+@dataclass(slots=True)
+class JudgeEvaluation:
+    """Result of judge evaluation with detailed feedback."""
+    is_accepted: bool
+    feedback: str
+    specific_issues: Optional[str] = None
+
+
+class Judge:
+    """
+    Judge agent that evaluates the quality of task outputs.
+    Used in actor-critic pattern to determine if work is satisfactory.
+
+    The underlying Agno agent is stateless between evaluations, so it is built
+    once per process and shared by all Judge instances.
+    """
+
+    _shared_agent: Optional[Agent] = None
+    _agent_lock = threading.Lock()
+
+    # Recent evaluations by (task, output) digest, so an unchanged output is not judged twice
+    _evaluation_cache: "OrderedDict[str, JudgeEvaluation]" = OrderedDict()
+    _evaluation_cache_size = 256
+
+    @property
+    def agent(self):
+        return self._get_shared_agent()
+
+    @classmethod
+    def _get_shared_agent(cls) -> Agent:
+        """Get the process-wide judge agent, building it on first use."""
+        if cls._shared_agent is None:
+            with cls._agent_lock:
+                if cls._shared_agent is None:
+                    cls._shared_agent = Agent(
+                        model=get_model(),
+                        description=JUDGE_SYSTEM_PROMPT,
+                        markdown=False,
+                        debug_mode=False
+                    )
+        return cls._shared_agent
+
+    def prebuild(self) -> None:
+        """Build the shared judge agent ahead of the first evaluation. No model calls are made."""
+        self._get_shared_agent()
+
+    async def evaluate(self, task_description: str, output: str) -> bool:
+        """
+        Evaluate if the agent output satisfactorily completes the task.
+        Backward compatibility method - returns only boolean.
+
+        Args:
+            task_description: The original task that was assigned
+            output: The agent's output to evaluate
+
+        Returns:
+            True if output is acceptable, False if it needs retry
+        """
+        evaluation = await self.evaluate_with_feedback(task_description, output)
+        return evaluation.is_accepted
+
+    @observe()
+    async def evaluate_with_feedback(self, task_description: str, output: str) -> JudgeEvaluation:
+        """
+        Evaluate with detailed feedback for retry improvement.
+
+        Args:
+            task_description: The original task that was assigned
+            output: The agent's output to evaluate
+
+        Returns:
+            JudgeEvaluation with decision and detailed feedback
+        """
+        key = self._evaluation_key(task_description, output)
+        cached = self._evaluation_cache.get(key)
+        if cached is not None:
+            self._evaluation_cache.move_to_end(key)
+            logger.info("Judge evaluation: reusing verdict for identical output")
+            return cached
+
+        prompt = "".join((
+            "Task: ", task_description,
+            _PROMPT_OUTPUT_HEADER, self._truncate_output(output),
+            _PROMPT_SUFFIX
+        ))
+
+        try:
+            result_content = await self._stream_response(prompt)
+
+            # Parse the structured response
+            is_accepted = _DECISION_ACCEPT_RE.search(result_content) is not None
+
+            # Extract feedback
+            feedback = ""
+            improvement_suggestions = ""
+
+            for match in _FIELD_RE.finditer(result_content):
+                if match.group(1).upper() == 'FEEDBACK':
+                    feedback = match.group(2).strip()
+                else:
+                    improvement_suggestions = match.group(2).strip()
+
+            # Fallback extraction if structured format not followed
+            if not feedback:
+                feedback = result_content[:200] + "..." if len(result_content) > 200 else result_content
+
+            langfuse.update_current_trace(
+                name="judge_evaluation_with_feedback",
+                input=f"Task: {task_description[:100]}...\nOutput: {output[:100]}...",
+                output=result_content,
+                tags=["judge", "evaluation", "feedback"]
+            )
+
+            logger.info(f"Judge evaluation: {'ACCEPTED' if is_accepted else 'REJECTED'}")
+
+            evaluation = JudgeEvaluation(
+                is_accepted=is_accepted,
+                feedback=feedback,
+                specific_issues=improvement_suggestions if improvement_suggestions else None
+            )
+            self._cache_evaluation(key, evaluation)
+            return evaluation
+
+        except Exception as e:
+            logger.error(f"Judge evaluation failed: {e}")
+            # If judge fails, accept the output (graceful degradation)
+            return JudgeEvaluation(
+                is_accepted=True,
+                feedback="Judge evaluation failed - accepting output",
+                specific_issues=None
+            )
+
+    @staticmethod
+    def _evaluation_key(task_description: str, output: str) -> str:
+        """Digest identifying a (task, output) pair."""
+        digest = hashlib.blake2b(task_description.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(output.encode())
+        return digest.hexdigest()
+
+    def _cache_evaluation(self, key: str, evaluation: JudgeEvaluation) -> None:
+        """Store an evaluation, evicting the least recently used entry when full."""
+        self._evaluation_cache[key] = evaluation
+        self._evaluation_cache.move_to_end(key)
+        if len(self._evaluation_cache) > self._evaluation_cache_size:
+            self._evaluation_cache.popitem(last=False)
+
+    @staticmethod
+    def _truncate_output(output: str) -> str:
+        """Keep the beginning and end of an oversized output, which carry most of the signal."""
+        if len(output) <= MAX_JUDGE_OUTPUT_CHARS:
+            return output
+
+        head = MAX_JUDGE_OUTPUT_CHARS // 2
+        tail = MAX_JUDGE_OUTPUT_CHARS - head
+        omitted = len(output) - MAX_JUDGE_OUTPUT_CHARS
+        return f"{output[:head]}\n\n[... {omitted} characters omitted ...]\n\n{output[-tail:]}"
+
+    async def _stream_response(self, prompt: str) -> str:
+        """
+        Stream the judge response, stopping early once it is decided.
+
+        An ACCEPT needs no improvement suggestions, so generation is cut off as
+        soon as the decision and the complete FEEDBACK line have arrived. A
+        REJECT is read to the end to collect the suggestions.
+
+        Args:
+            prompt: Evaluation prompt for the judge agent
+
+        Returns:
+            The (possibly partial) response text
+        """
+        chunks = []
+        length = 0
+        stream = self.agent.arun(prompt, stream=True)
+        try:
+            async for event in stream:
+                if not isinstance(event, RunContentEvent) or not isinstance(event.content, str):
+                    continue
+
+                chunks.append(event.content)
+                length += len(event.content)
+                if length >= MAX_JUDGE_RESPONSE_CHARS:
+                    logger.warning("Judge response exceeded the size cap, evaluating the truncated output")
+                    break
+
+                # A field is only complete once its line ends
+                if '\n' in event.content:
+                    content = ''.join(chunks)
+                    if _DECISION_ACCEPT_RE.search(content) and _FEEDBACK_LINE_RE.search(content):
+                        break
+        finally:
+            await stream.aclose()
+
+        return ''.join(chunks)
\ No newline at end of file
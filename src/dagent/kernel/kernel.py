@@ -0,0 +1,758 @@
+"""Kernel agent for orchestrating DAG execution with real Agno agents."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
+from dataclasses import dataclass
+import time
+
+from agno.agent import Agent
+from agno.team import Team
+
+from dagent.dag import DAG, DAGNode
+from dagent.tools import YFinanceTools, WebSearchTools, FileEditorTools
+from .profiles import ProfileGenerator
+from .judge import Judge
+
+# Import centralized tracing
+from dagent.utils import get_model
+from dagent.tracing import langfuse, observe
+
+logger = logging.getLogger(__name__)
+
+# Agent LLM calls in flight at once unless DAGENT_MAX_CONCURRENCY says otherwise
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Seconds to wait for the provider to answer the warmup ping
+WARMUP_TIMEOUT = 2.0
+
+# Number of file changes kept in the global context; only the most recent few are shown
+MAX_CHANGES_LOG = 256
+
+# Tools that modify the environment; agents using them never share an in-flight call
+_SIDE_EFFECT_TOOLS = frozenset({"FileEditor"})
+
+# Console banners and separators
+_BANNER = "=" * 60
+_RULE = "-" * 50
+_SHORT_RULE = "-" * 40
+
+# Fixed parts of the node execution prompt
+_ENVIRONMENT_HEADER = "Environment State:"
+_CONTEXT_HEADER = "Context from previous tasks:\n"
+_TASK_PREFIX = "Task: "
+_RETRY_REJECTED = "Your previous attempt was rejected by the quality judge."
+_RETRY_INSTRUCTION = "\nPlease address the judge's feedback and improve your response accordingly."
+
+# Patterns for file names in ACT task descriptions, most specific first
+_FILENAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"['\"]([^'\"]+\.(py|txt|json|csv|md|yaml|yml|js|ts|html|css))['\"]",  # quoted filenames
+    r"named?\s+['\"]?([^'\"\s]+\.(py|txt|json|csv|md|yaml|yml|js|ts|html|css))['\"]?",  # "named X" or "name X"
+    r"file\s+['\"]?([^'\"\s]+\.(py|txt|json|csv|md|yaml|yml|js|ts|html|css))['\"]?",  # "file X"
+    r"([a-zA-Z0-9_-]+\.(py|txt|json|csv|md|yaml|yml|js|ts|html|css))"  # any filename with extension
+))
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionResult:
+    """Result of executing a single DAG node."""
+    node_id: str
+    result: str
+    execution_time: float
+    agent_profile: str
+    tools_used: Tuple[str, ...]
+    success: bool
+    error: str = None
+
+
+def _max_concurrency_from_env() -> int:
+    """Read DAGENT_MAX_CONCURRENCY, falling back to the default for missing or invalid values."""
+    value = os.getenv("DAGENT_MAX_CONCURRENCY")
+    if value is None:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        max_concurrency = int(value)
+    except ValueError:
+        max_concurrency = 0
+    if max_concurrency < 1:
+        logger.warning(f"Ignoring invalid DAGENT_MAX_CONCURRENCY={value!r}, using {DEFAULT_MAX_CONCURRENCY}")
+        return DEFAULT_MAX_CONCURRENCY
+    return max_concurrency
+
+
+def _print_banner(title: str) -> None:
+    """Print a section title between two banner lines."""
+    print(f"\n{_BANNER}\n{title}\n{_BANNER}")
+
+
+class KernelAgent:
+    """
+    Kernel that creates real Agno agents for each DAG node and orchestrates execution.
+    """
+    
+    def __init__(self, max_context_chars: Optional[int] = None, max_concurrency: Optional[int] = None):
+        """
+        Args:
+            max_context_chars: Optional cap on the characters of each dependency
+                result passed on as context; longer results are truncated
+            max_concurrency: Maximum number of agent LLM calls in flight at once;
+                defaults to DAGENT_MAX_CONCURRENCY or DEFAULT_MAX_CONCURRENCY
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency is None:
+            max_concurrency = _max_concurrency_from_env()
+        elif max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self.node_agents: Dict[str, Agent] = {}
+        self.max_context_chars = max_context_chars
+        self.max_concurrency = max_concurrency
+        self._llm_sem: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._node_labels: Dict[str, Tuple[str, str]] = {}
+        self.profile_generator = ProfileGenerator()
+        self.tool_registry = self._create_tool_registry()
+        self._tool_instances: Dict[str, Any] = {}
+        self._models: Dict[float, Any] = {}
+        self.judge = Judge()
+        self.global_context = {
+            "modified_files": [],
+            "changes_log": deque(maxlen=MAX_CHANGES_LOG),
+            "current_version": 1
+        }
+        self._modified_files_set: Set[str] = set()  # Membership index for global_context["modified_files"]
+        
+    def _create_tool_registry(self) -> Dict[str, Any]:
+        """Create registry of available tool classes."""
+        return {
+            'YFinanceTools': YFinanceTools,
+            'WebSearchTools': WebSearchTools,
+            'FileEditor': FileEditorTools
+        }
+    
+    def _get_model(self, temperature: float = 0.3) -> Any:
+        """
+        Get the shared model instance for a temperature, creating it on first use.
+
+        Agents do not modify their model, so all agents with the same settings share
+        one instance and with it the provider client and its connection pool.
+        """
+        model = self._models.get(temperature)
+        if model is None:
+            model = self._models[temperature] = get_model(temperature=temperature)
+        return model
+
+    def prebuild(self) -> None:
+        """
+        Create the shared models and the judge agent ahead of the first workflow.
+
+        This only builds Python objects; no model calls are made and no provider
+        connection is opened (see warmup()).
+        """
+        self._get_model(temperature=0.5)  # Single agents
+        self._get_model()  # Team members
+        self.judge.prebuild()
+
+    async def warmup(self, timeout: float = WARMUP_TIMEOUT) -> bool:
+        """
+        Pay the provider's first-call costs before the first node runs.
+
+        Sends a trivial "ping" prompt through the shared single-agent model, so its
+        client is created and authenticated and, where the provider client is kept
+        on the model (Gemini), its HTTP/TLS connection is already open.
+        This is a (tiny) real model call, so it is opt-in: see DAGENT_WARMUP and
+        the ``dagent warmup`` command.
+
+        Args:
+            timeout: Seconds to wait for the ping before giving up
+
+        Returns:
+            bool: True if the provider answered within the timeout
+        """
+        self.prebuild()
+        ping_agent = Agent(model=self._get_model(temperature=0.5), markdown=False, debug_mode=False)
+        try:
+            await asyncio.wait_for(ping_agent.arun("ping"), timeout)
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e!r}")
+            return False
+        return True
+
+    def _get_node_labels(self, node: DAGNode) -> Tuple[str, str]:
+        """Get the (profile, tools) display strings of a node, computed once per node."""
+        labels = self._node_labels.get(node.id)
+        if labels is None:
+            if node.node_type == "AGENT_TEAM":
+                labels = (f"TEAM:{node.team_config.get('collaboration_pattern', 'collaborate')}", "team tools")
+            else:
+                labels = (f"{node.agent_profile.task_type}:{node.agent_profile.complexity}", ', '.join(node.tool_allowlist))
+            self._node_labels[node.id] = labels
+        return labels
+
+    @staticmethod
+    def _get_tools_used(node: DAGNode) -> Tuple[str, ...]:
+        """Get the tools reported in the execution result of a node."""
+        return ("team_tools",) if node.node_type == "AGENT_TEAM" else node.tool_allowlist
+
+    def _get_tool(self, tool_name: str) -> Any:
+        """
+        Get the shared instance of a registered tool, creating it on first use.
+
+        The toolkits keep no per-agent state, so one instance can serve every agent.
+        Returns None for tools that are not in the registry.
+        """
+        tool = self._tool_instances.get(tool_name)
+        if tool is None and tool_name in self.tool_registry:
+            tool = self._tool_instances[tool_name] = self.tool_registry[tool_name]()
+        return tool
+    
+    async def execute_workflow(self, dag: DAG) -> Dict[str, ExecutionResult]:
+        """
+        Main workflow execution:
+        1. Create real Agno agents for each DAG node
+        2. Execute DAG with dependency management
+
+        Raises:
+            ValueError: If the DAG has missing dependencies or cycles
+        """
+        # Fail before any agent is created rather than when the schedule runs dry
+        is_valid, errors = dag.validate()
+        if not is_valid:
+            raise ValueError(f"Invalid DAG structure: {'; '.join(errors)}")
+
+        _print_banner("KERNEL AGENT: Starting Workflow Execution")
+        
+        # Step 1: Create all agents
+        self._node_labels.clear()
+        self._llm_sem = asyncio.Semaphore(self.max_concurrency)  # Created per run, on the running loop
+        await self._create_node_agents(dag)
+        
+        # Step 2: Execute DAG
+        _print_banner("KERNEL AGENT: Executing DAG")
+        
+        results = await self._execute_dag_with_display(dag)
+        
+        _print_banner("KERNEL AGENT: Workflow Completed")
+        
+        return results
+    
+    async def _create_node_agents(self, dag: DAG):
+        """Create real Agno agents for each DAG node."""
+        print(f"\nKERNEL: Creating Real Agno Agents\n{_SHORT_RULE}\nCreating {len(dag.nodes)} Agno agents (one per subtask)...")
+        
+        start_time = time.perf_counter()
+        
+        # Create agents in parallel
+        async with asyncio.TaskGroup() as tg:
+            for node in dag.nodes.values():
+                tg.create_task(self._create_single_node_agent(node))
+        
+        creation_time = time.perf_counter() - start_time
+        print(f"All {len(dag.nodes)} Agno agents created in {creation_time:.2f}s")
+        
+        # Show created agents
+        lines = ["\nCreated Agno Agents:"]
+        for node_id, agent in self.node_agents.items():
+            tools_str = ', '.join([tool.__class__.__name__ for tool in agent.tools]) if agent.tools else "No tools"
+            lines.append(f"  • {node_id} ({getattr(agent, '_profile_type', 'unknown')}): [{tools_str}]")
+        print("\n".join(lines))
+    
+    async def _create_single_node_agent(self, node: DAGNode):
+        """Create a real Agno agent or team for a specific node."""
+        try:
+            if node.node_type == "AGENT_TEAM":
+                # Create agno team
+                team = await self._create_team(node)
+                self.node_agents[node.id] = team
+                print(f"  Created Agno team: {node.id}")
+                return team
+            else:
+                # Create single agent (existing logic)
+                # Create tool instances for this agent
+                tools = []
+                for tool_name in node.tool_allowlist:
+                    tool_instance = self._get_tool(tool_name)
+                    if tool_instance is not None:
+                        tools.append(tool_instance)
+                    else:
+                        logger.warning(f"Tool {tool_name} not found in registry")
+
+                # Create the real Agno agent off the event loop, as construction is synchronous.
+                # Shared models and tools are resolved here so their caches stay on the loop thread.
+                agent = await asyncio.to_thread(self._build_agent, node, tools, self._get_model(temperature=0.5))
+
+                # Store profile type for display purposes
+                agent._profile_type = self._get_node_labels(node)[0]
+
+                self.node_agents[node.id] = agent
+
+                print(f"  Created Agno agent: {node.id}")
+                return agent
+
+        except Exception as e:
+            logger.error(f"Failed to create agent for {node.id}: {e}")
+            raise e
+
+    def _build_agent(self, node: DAGNode, tools: List[Any], model: Any) -> Agent:
+        """Build the Agno agent for a single-agent node. Synchronous, so it can run in a worker thread."""
+        agent = Agent(
+            model=model,
+            tools=tools,
+            description=node.generated_system_prompt,  # Use pre-generated profile from DAG node
+            markdown=False,
+            debug_mode=False
+        )
+        agent._node_id = node.id
+        return agent
+
+    def _build_team_member(self, agent_config: Dict[str, Any], tools: List[Any], model: Any) -> Agent:
+        """Build one team member agent. Synchronous, so it can run in a worker thread."""
+        return Agent(
+            name=agent_config["role"],
+            role=agent_config.get("description", f"Agent for {agent_config['role']}"),
+            model=model,
+            tools=tools,
+            debug_mode=False
+        )
+
+    async def _create_team(self, node: DAGNode) -> Team:
+        """Create an agno team from team config."""
+        team_config = node.team_config
+
+        # Create individual agents for the team concurrently, off the event loop.
+        # Shared tools and the model are resolved here so their caches stay on the loop thread.
+        model = self._get_model()
+        agents = await asyncio.gather(*(
+            asyncio.to_thread(
+                self._build_team_member,
+                agent_config,
+                [self._get_tool(tool_name) for tool_name in agent_config.get("tools", []) if tool_name in self.tool_registry],
+                model
+            )
+            for agent_config in team_config["agents"]
+        ))
+
+        # Create the team with generated system prompt, off the event loop as well
+        team = await asyncio.to_thread(
+            Team,
+            name=f"Team_{node.id}",
+            mode=team_config.get("collaboration_pattern", "collaborate"),
+            members=agents,
+            instructions=node.generated_system_prompt,  # Use pre-generated team prompt
+            debug_mode=False
+        )
+
+        # Store team info for display
+        team._profile_type = self._get_node_labels(node)[0]
+        team._node_id = node.id
+
+        return team
+    
+    async def _execute_dag_with_display(self, dag: DAG) -> Dict[str, ExecutionResult]:
+        """
+        Execute DAG with real Agno agents.
+
+        Each node starts as soon as its own dependencies have completed instead of
+        waiting for the whole previous round, so one slow task only delays the
+        nodes that actually depend on it.
+        """
+        completed = {}
+        round_num = 1
+        final_nodes = dag.get_final_nodes()  # Get final nodes for judge optimization
+        running: Dict[asyncio.Task, DAGNode] = {}
+        started: Dict[str, float] = {}  # First start of each node, kept across requeues
+        # Depth of each node, shown with each start as rounds no longer line up with levels
+        levels = {node_id: level for level, node_ids in enumerate(dag.topo_levels()) for node_id in node_ids}
+        critical_path = dag.critical_path_lengths()
+        dag.reset_schedule()
+        
+        try:
+            while not dag.is_complete():
+                # Start every node whose dependencies are now met (maintained incrementally),
+                # longest remaining chain first so it gets the concurrency slots first
+                ready_ids = sorted(dag.pop_ready(), key=critical_path.__getitem__, reverse=True)
+                ready_nodes = [dag.nodes[node_id] for node_id in ready_ids]
+                if ready_nodes:
+                    lines = [f"\nROUND {round_num}: Starting {len(ready_nodes)} tasks ({len(running) + len(ready_nodes)} running)", _RULE]
+                    round_num += 1
+                    for node in ready_nodes:
+                        profile_str, tools_str = self._get_node_labels(node)
+                        lines.append(f"  Starting: {node.id} ({profile_str}) [Tools: {tools_str}] [Level {levels[node.id]}]")
+                        if node.dependencies:
+                            lines.append(f"    Dependencies: {', '.join(node.dependencies)}")
+                    print("\n".join(lines))
+                
+                for node in ready_nodes:
+                    task = asyncio.create_task(self._execute_node_with_display(node, completed, final_nodes))
+                    running[task] = node
+                    started.setdefault(node.id, time.perf_counter())
+                
+                if not running:
+                    raise ValueError("No ready nodes - circular dependency detected")
+                
+                # Wait for the next task to finish and schedule whatever it unblocks
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                lines = ["\nCOMPLETED:"]
+                for task in done:
+                    node = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        lines.append(f"  ✗ Task {node.id} failed with exception: {e}")
+                        if dag.requeue(node.id):  # Not completed - schedule again
+                            continue
+                        # Out of retries - record the failure so dependents can still run
+                        result = ExecutionResult(
+                            node_id=node.id,
+                            result="",
+                            execution_time=time.perf_counter() - started[node.id],
+                            agent_profile=self._get_node_labels(node)[0],
+                            tools_used=self._get_tools_used(node),
+                            success=False,
+                            error=str(e)
+                        )
+                    
+                    completed[result.node_id] = result
+                    dag.mark_completed(result.node_id)
+                    status = "✓" if result.success else "✗"
+                    lines.append(f"  {status} {result.node_id}: {result.execution_time:.2f}s")
+                print("\n".join(lines))
+        finally:
+            # Don't leave node tasks running if execution is aborted
+            for task in running:
+                task.cancel()
+            # Shared LLM calls are shielded from their waiters, so cancel them explicitly
+            for task in self._inflight.values():
+                task.cancel()
+            self._inflight.clear()
+        
+        return completed
+    
+    async def _run_agent(self, node: DAGNode, agent: Any, prompt: str) -> Any:
+        """
+        Run an agent on a prompt, sharing the call with identical in-flight requests.
+
+        Read-only single agents with the same system prompt, tools and full prompt would
+        produce the same kind of answer, so while one such call is running, other nodes
+        await its response instead of issuing a duplicate request. Teams, ACT agents and
+        agents with side-effecting tools always make their own call, as each node has to
+        carry out its actions itself.
+        """
+        if (node.node_type != "SINGLE_AGENT" or node.agent_profile.task_type == "ACT"
+                or not _SIDE_EFFECT_TOOLS.isdisjoint(node.tool_allowlist)):
+            async with self._llm_sem:
+                return await agent.arun(prompt)
+
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (node.generated_system_prompt or "", self._get_node_labels(node)[1], prompt):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        key = digest.hexdigest()
+
+        task = self._inflight.get(key)
+        if task is None:
+            async def run():
+                async with self._llm_sem:
+                    return await agent.arun(prompt)
+
+            task = self._inflight[key] = asyncio.create_task(run())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Reusing in-flight response for %s", node.id)
+        # Shield the shared call so that cancelling one waiter does not cancel it for the others
+        return await asyncio.shield(task)
+
+    @observe()
+    async def _execute_node_with_display(self, node: DAGNode, completed: Dict[str, ExecutionResult], final_nodes: FrozenSet[str]) -> ExecutionResult:
+        """Execute a single node with actor-critic retry logic and feedback injection."""
+        overall_start_time = time.perf_counter()
+        judge_feedback_history = []  # Track feedback from previous attempts
+        profile_str, tools_str = self._get_node_labels(node)
+        is_team = node.node_type == "AGENT_TEAM"
+        tools_used = self._get_tools_used(node)
+        is_final_node = node.id in final_nodes
+        is_act = node.node_type == "SINGLE_AGENT" and node.agent_profile and node.agent_profile.task_type == "ACT"
+
+        # Create appropriate tags for langfuse based on node type
+        if is_team:
+            task_tag = f"team_{node.team_config.get('collaboration_pattern', 'collaborate')}"
+        else:
+            task_tag = node.agent_profile.task_type
+
+        # Dependency previews are the same for every attempt
+        if node.dependencies:
+            input_lines = ["Input Context:"]
+            for dep_id in node.dependencies:
+                if (dep_result := completed.get(dep_id)) is not None:
+                    dep_result = dep_result.result
+                    preview = dep_result[:100] + "..." if len(dep_result) > 100 else dep_result
+                    input_lines.append(f"  ├─ {dep_id}: {preview}")
+            input_context = "\n".join(input_lines)
+        else:
+            input_context = "Input Context: None (root task)"
+
+        # Get the real Agno agent for this node
+        agent = self.node_agents[node.id]
+
+        # Create the prompt with context and task. Dependencies are complete before a node
+        # runs, so this part of the prompt is the same for every attempt.
+        base_prompt = _TASK_PREFIX + node.task_description
+        context = self._build_context_for_node(node, completed)
+        if context:
+            base_prompt = _CONTEXT_HEADER + context + "\n\n" + base_prompt
+
+        # Actor-Critic Loop: Try up to max_retries + 1 times
+        for attempt in range(node.max_retries + 1):
+            start_time = time.perf_counter()
+            is_final_attempt = (attempt == node.max_retries)
+            # Display lines for this attempt, printed as one block so that the output of
+            # concurrently running nodes does not interleave
+            display = []
+
+            try:
+                # Prompt sections, joined once so the (possibly large) base prompt is copied once
+                prompt_parts = []
+
+                # Add global context (environment state), which ACT nodes may change between attempts
+                if self.global_context["changes_log"]:
+                    env_parts = [_ENVIRONMENT_HEADER, f"Current Version: {self.global_context['current_version']}"]
+                    if self.global_context["modified_files"]:
+                        env_parts.append(f"Modified Files: {', '.join(self.global_context['modified_files'])}")
+                    for change in self._recent_changes():
+                        env_parts.append(f"  - {change['type']}: {change.get('file', change.get('description', 'N/A'))}")
+                    env_parts.append("\n")
+                    prompt_parts.append("\n".join(env_parts))
+
+                prompt_parts.append(base_prompt)
+
+                # Add retry context with specific judge feedback
+                if attempt > 0 and judge_feedback_history:
+                    # Inject specific feedback from judge
+                    latest_feedback = judge_feedback_history[-1]
+                    retry_parts = [
+                        "",
+                        f"\n[RETRY ATTEMPT {attempt + 1}/{node.max_retries + 1}]",
+                        _RETRY_REJECTED,
+                        f"\nJudge Feedback: {latest_feedback.feedback}",
+                    ]
+                    if latest_feedback.specific_issues:
+                        retry_parts.append(f"Specific Issues to Address: {latest_feedback.specific_issues}")
+                    retry_parts.append(_RETRY_INSTRUCTION)
+                    prompt_parts.append("\n".join(retry_parts))
+
+                full_prompt = "".join(prompt_parts)
+
+                # Execute with the real Agno agent
+                logger.info("Executing agent %s (attempt %d/%d)", node.id, attempt + 1, node.max_retries + 1)
+                response = await self._run_agent(node, agent, full_prompt)
+
+                # Extract result content
+                result_content = getattr(response, 'content', None)
+                if result_content is None:
+                    result_content = str(response)
+
+                # Update global context for ACT operations
+                if is_act:
+                    self._update_global_context_for_act(node, result_content)
+
+                execution_time = time.perf_counter() - start_time
+
+                # Show detailed execution info
+                retry_info = f" (RETRY {attempt + 1})" if attempt > 0 else ""
+                display.append(f"\n--- EXECUTING: {node.id}{retry_info} ---")
+                display.append(input_context)
+
+                # Show judge feedback if this is a retry
+                if attempt > 0 and judge_feedback_history:
+                    latest_feedback = judge_feedback_history[-1]
+                    display.append(f"Judge Feedback: {latest_feedback.feedback}")
+                    if latest_feedback.specific_issues:
+                        display.append(f"Issues to Address: {latest_feedback.specific_issues}")
+
+                display.append(f"Agent: {node.id} ({profile_str})")
+                display.append(f"Tools: {tools_str}")
+                display.append("Output:")
+                # Show full output
+                display.append("  " + result_content.replace("\n", "\n  "))
+                display.append(f"Execution time: {execution_time:.2f}s")
+
+                # Judge evaluation (Actor-Critic) - Skip for final nodes to save tokens
+                outcome = "final" if is_final_attempt else "no_validation"
+                if node.needs_validation and not is_final_attempt and not is_final_node:
+                    display.append("Judge evaluating output...")
+                    try:
+                        evaluation = await self.judge.evaluate_with_feedback(node.task_description, result_content)
+
+                        if evaluation.is_accepted:
+                            display.append("Judge ACCEPTED the output")
+                            display.append(f"Judge Feedback: {evaluation.feedback}")
+                            outcome = "accepted"
+                        else:
+                            display.append("Judge REJECTED the output")
+                            display.append(f"Judge Feedback: {evaluation.feedback}")
+                            if evaluation.specific_issues:
+                                display.append(f"Issues to Address: {evaluation.specific_issues}")
+
+                            # Store feedback for next retry attempt
+                            judge_feedback_history.append(evaluation)
+
+                            display.append("Retrying with judge feedback...")
+                            display.append(_RULE)
+                            continue  # Try again with feedback
+
+                    except Exception as judge_error:
+                        logger.warning("Judge evaluation failed: %s, accepting output", judge_error)
+                        display.append("Judge evaluation failed, accepting output")
+                else:
+                    if is_final_node:
+                        display.append("Skipping judge validation (final node - saves tokens)")
+                    else:
+                        display.append("No validation needed or final attempt")
+
+                # Accepted, final attempt or no validation needed - return result
+                langfuse.update_current_trace(
+                    name=node.id,
+                    input=full_prompt,
+                    output=result_content,
+                    tags=["agent", task_tag, outcome]
+                )
+                display.append(_RULE)
+                return ExecutionResult(
+                    node_id=node.id,
+                    result=result_content,
+                    execution_time=time.perf_counter() - overall_start_time,
+                    agent_profile=profile_str,
+                    tools_used=tools_used,
+                    success=True
+                )
+
+            except Exception as e:
+                logger.error("Task %s attempt %d failed: %s", node.id, attempt + 1, e)
+                display.append(f"ERROR in {node.id} attempt {attempt + 1}: {str(e)}")
+
+                if is_final_attempt:
+                    # Final attempt failed - return error result
+                    display.append(_RULE)
+                    return ExecutionResult(
+                        node_id=node.id,
+                        result="",
+                        execution_time=time.perf_counter() - overall_start_time,
+                        agent_profile=profile_str,
+                        tools_used=tools_used,
+                        success=False,
+                        error=str(e)
+                    )
+                else:
+                    display.append("Retrying after error...")
+                    continue
+
+            finally:
+                if display:
+                    print("\n".join(display))
+    
+    def _update_global_context_for_act(self, node: DAGNode, result_content: str):
+        """Update global context after ACT operations using tool-based detection."""
+        # Option 2: Tool-based detection - simple and reliable
+        modified_files = []
+
+        # Check if FileEditor tools were used successfully
+        if ("FileEditor" in node.tool_allowlist and
+            result_content and
+            "error" not in result_content.lower() and
+            "failed" not in result_content.lower()):
+
+            # Extract filename from task description (more reliable than parsing output)
+            for pattern in _FILENAME_PATTERNS:
+                # Every pattern captures the filename in its first group
+                modified_files = [match.group(1) for match in pattern.finditer(node.task_description)]
+                if modified_files:
+                    break  # Use first matching pattern
+
+
+        # Update global context if files were detected
+        if modified_files:
+            timestamp = datetime.now().isoformat()  # One timestamp for all files of this update
+            for file_path in modified_files:
+                if file_path not in self._modified_files_set:
+                    self._modified_files_set.add(file_path)
+                    self.global_context["modified_files"].append(file_path)
+
+                # Add to change log
+                self.global_context["changes_log"].append({
+                    "type": "file_operation",
+                    "file": file_path,
+                    "node_id": node.id,
+                    "timestamp": timestamp
+                })
+
+            # Increment version
+            self.global_context["current_version"] += 1
+
+            logger.info(f"Updated global context - Version {self.global_context['current_version']}, Modified files: {modified_files}")
+
+            # Print global context for debugging
+            lines = [
+                "\n🌐 GLOBAL CONTEXT UPDATED:",
+                f"   Version: {self.global_context['current_version']}",
+                f"   Modified Files: {self.global_context['modified_files']}",
+                "   Recent Changes:",
+            ]
+            for change in self._recent_changes():
+                lines.append(f"     - {change['type']}: {change.get('file', 'N/A')} (by {change.get('node_id', 'unknown')})")
+            lines.append("")
+            print("\n".join(lines))
+
+    def _recent_changes(self, count: int = 3) -> List[Dict[str, Any]]:
+        """Get the last few entries of the changes log, oldest first."""
+        return list(islice(reversed(self.global_context["changes_log"]), count))[::-1]
+
+    def _build_context_for_node(self, node: DAGNode, completed: Dict[str, ExecutionResult]) -> str:
+        """Build context from dependency outputs."""
+        if not node.dependencies:
+            return ""
+
+        context_parts = []
+        for dep_id in node.dependencies:
+            if (dep_result := completed.get(dep_id)) is None:
+                continue
+            if dep_result.success:
+                result = dep_result.result
+                if self.max_context_chars is not None and len(result) > self.max_context_chars:
+                    omitted = len(result) - self.max_context_chars
+                    result = f"{result[:self.max_context_chars]}\n[... {omitted} characters truncated ...]"
+                context_parts.append(f"Results from {dep_id}:\n{result}")
+            else:
+                context_parts.append(f"Task {dep_id} failed: {dep_result.error}")
+
+        return "\n\n".join(context_parts)
+
+
+class WorkflowExecutor:
+    """Simple interface for complete workflow execution."""
+    
+    def __init__(self, max_context_chars: Optional[int] = None, max_concurrency: Optional[int] = None):
+        self.kernel = KernelAgent(max_context_chars=max_context_chars, max_concurrency=max_concurrency)
+        self.kernel.prebuild()
+        # With DAGENT_WARMUP=1, connect to the provider in the background (e.g. while
+        # the plan is being created) so the first node does not pay for it
+        self._warmup_task: Optional[asyncio.Task] = None
+        if os.getenv("DAGENT_WARMUP") == "1":
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.info("DAGENT_WARMUP is set but no event loop is running; skipping warmup")
+            else:
+                self._warmup_task = loop.create_task(self.kernel.warmup())
+    
+    async def execute(self, dag: DAG) -> Dict[str, ExecutionResult]:
+        """Execute complete workflow from DAG."""
+        return await self.kernel.execute_workflow(dag)
\ No newline at end of file
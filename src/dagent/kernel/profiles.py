@@ -0,0 +1,392 @@
+"""Profile generation for agents based on tasks and tools."""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import json
+import logging
+from dagent.planner.planner import AgentProfile
+from agno.agent import Agent
+from .prompts import (
+    PROFILE_GENERATOR_SYSTEM_PROMPT,
+    PROFILE_GENERATOR_TASK_PROMPT,
+    PROFILE_GENERATOR_BATCH_PROMPT,
+    PROFILE_GENERATOR_BATCH_ITEM_PROMPT,
+)
+
+# Import centralized tracing
+from dagent.utils import get_model, cache_enabled, cache_key, cache_get, cache_put
+from dagent.tracing import langfuse, observe
+
+logger = logging.getLogger(__name__)
+
+# Descriptions of the AgentProfile fields used in the profile prompts
+_TASK_TYPE_DESCRIPTIONS = {
+    "SEARCH": "Information retrieval, data gathering, web search, API calls",
+    "THINK": "Analysis, reasoning, processing existing data, decision making",
+    "AGGREGATE": "Synthesis, combining results, final report generation",
+    "ACT": "Environment modifications, file operations, external actions"
+}
+
+_COMPLEXITY_DESCRIPTIONS = {
+    "QUICK": "Simple, straightforward tasks with minimal reasoning",
+    "THOROUGH": "Systematic analysis requiring detailed reasoning and validation",
+    "DEEP": "Comprehensive multi-perspective analysis with extensive reasoning"
+}
+
+_OUTPUT_FORMAT_DESCRIPTIONS = {
+    "DATA": "Raw facts, structured information, search results, extracted data",
+    "ANALYSIS": "Insights, patterns, conclusions, comparative analysis",
+    "REPORT": "Final formatted answers, summaries, recommendations"
+}
+
+_REASONING_STYLE_DESCRIPTIONS = {
+    "DIRECT": "Fact-focused, straightforward, minimal interpretation",
+    "ANALYTICAL": "Step-by-step methodology, systematic reasoning",
+    "CREATIVE": "Multi-angle exploration, alternative perspectives, comprehensive synthesis"
+}
+
+_TOOL_DESCRIPTIONS = {
+    "YFinanceTools": "Financial data from Yahoo Finance - get stock prices, company info, financial statements, analyst recommendations, price history",
+    "WebSearchTools": "Web search using Exa API - search general web content, recent news articles, financial news, get news summaries",
+    "FileEditor": "File operations - create, read, write, modify files, save content, create scripts, manage file system"
+}
+
+
+@lru_cache(maxsize=256)
+def _describe_tools(tools: Tuple[str, ...]) -> str:
+    """Describe a tool set, one line per tool. Tool sets repeat across nodes, so results are cached."""
+    return "\n".join(
+        f"- {tool}: {_TOOL_DESCRIPTIONS.get(tool, f'{tool} - tool description not available')}"
+        for tool in tools
+    )
+
+
+class ProfileGenerator:
+    """Generates detailed agent profiles based on tasks and tools."""
+
+    # Generated profiles shared by every generator in the process, keyed by the model and
+    # the inputs that determine the prompt (see _profile_cache_key)
+    _profile_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+    _profile_cache_size = 1024
+
+    def __init__(self):
+        # self._llm_agent = Agent(
+        #     model=OpenAIChat(id="gpt-4o-mini"),
+        #     description="You are a system prompt generator for AI agents. Generate clear, focused system prompts based on agent profiles and tasks.",
+        #     markdown=False,
+        #     debug_mode=False
+        # )
+
+        self._llm_agent = Agent(
+            model=get_model(),
+            description=PROFILE_GENERATOR_SYSTEM_PROMPT,
+            markdown=False,
+            debug_mode=False
+        )
+
+    @observe()
+    async def generate_profile(self, agent_profile: AgentProfile, task_description: str, tools: List[str], dependencies: List[str] = None) -> str:
+        """Generate a detailed agent profile using LLM.
+
+        Args:
+            agent_profile (AgentProfile): Structured agent profile with semantic fields
+            task_description (str): Description of the task the agent will perform
+            tools (List[str]): List of tools available to the agent
+            dependencies (List[str]): List of dependency task IDs
+
+        Returns:
+            str: Generated agent profile/system prompt
+        """
+        profile_str = f"{agent_profile.task_type}:{agent_profile.complexity}"
+        cache_key = self._profile_cache_key(agent_profile, task_description, tools, dependencies)
+        cached_profile = await self._get_cached_profile(cache_key)
+        if cached_profile is not None:
+            logger.info(f"Using cached {profile_str} profile for task: {task_description[:50]}...")
+            return cached_profile
+
+        logger.info(f"Generating {profile_str} profile for task: {task_description[:50]}...")
+
+        prompt = PROFILE_GENERATOR_TASK_PROMPT.format(
+            **self._get_prompt_fields(agent_profile, task_description, tools, dependencies)
+        )
+
+        response = await self._llm_agent.arun(prompt)
+        generated_profile = response.content.strip()
+
+        langfuse.update_current_trace(
+            name=f"generate_profile_{agent_profile.task_type}_{agent_profile.complexity}",
+            input=prompt,
+            output=generated_profile,
+            tags=["profile_generation", agent_profile.task_type]
+        )
+
+        await self._cache_profile(cache_key, generated_profile)
+        logger.info(f"Profile generated successfully for {profile_str}")
+        return generated_profile
+
+    async def generate_profiles_batched(self, specs: Dict[str, Dict[str, Any]], batch_size: int = 8) -> Dict[str, str]:
+        """Generate profiles for many agents with one LLM call per batch.
+
+        Several agent specifications are marshaled into a single prompt and the
+        LLM answers with a JSON object of system prompts keyed by task id. Batches
+        run concurrently; any agent missing from a batch response falls back to
+        an individual ``generate_profile`` call. Agents whose profile is already
+        cached are not sent to the LLM at all, and agents with identical inputs
+        share a single generated profile.
+
+        Args:
+            specs (Dict[str, Dict[str, Any]]): Task id -> keyword arguments for
+                ``generate_profile`` (agent_profile, task_description, tools, dependencies)
+            batch_size (int): Maximum number of agents per LLM call
+
+        Returns:
+            Dict[str, str]: Task id -> generated agent profile/system prompt
+        """
+        generated_profiles = {}
+        task_ids = []
+        first_task_for_key = {}
+        duplicates = {}  # task id -> task id generating the same profile
+        for task_id, spec in specs.items():
+            cache_key = self._profile_cache_key(**spec)
+            cached_profile = await self._get_cached_profile(cache_key)
+            if cached_profile is not None:
+                generated_profiles[task_id] = cached_profile
+            elif cache_key in first_task_for_key:
+                duplicates[task_id] = first_task_for_key[cache_key]
+            else:
+                first_task_for_key[cache_key] = task_id
+                task_ids.append(task_id)
+
+        if generated_profiles:
+            logger.info(f"Reusing {len(generated_profiles)} cached profile(s)")
+        if duplicates:
+            logger.info(f"Sharing profiles for {len(duplicates)} duplicate agent(s)")
+
+        batches = [task_ids[i:i + batch_size] for i in range(0, len(task_ids), batch_size)]
+
+        # A failing batch cancels its siblings instead of leaving them running
+        try:
+            async with asyncio.TaskGroup() as tg:
+                batch_tasks = [
+                    tg.create_task(self._generate_profile_batch({task_id: specs[task_id] for task_id in batch}))
+                    for batch in batches
+                ]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+
+        for task in batch_tasks:
+            generated_profiles.update(task.result())
+        for task_id, source_task_id in duplicates.items():
+            generated_profiles[task_id] = generated_profiles[source_task_id]
+        return generated_profiles
+
+    @observe()
+    async def _generate_profile_batch(self, specs: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Generate the profiles of a single batch, falling back to per-agent calls."""
+        if len(specs) == 1:
+            task_id, spec = next(iter(specs.items()))
+            return {task_id: await self.generate_profile(**spec)}
+
+        agent_specs = "\n\n".join(
+            PROFILE_GENERATOR_BATCH_ITEM_PROMPT.format(
+                task_id=task_id,
+                **self._get_prompt_fields(
+                    spec["agent_profile"], spec["task_description"], spec.get("tools"), spec.get("dependencies")
+                )
+            )
+            for task_id, spec in specs.items()
+        )
+        prompt = PROFILE_GENERATOR_BATCH_PROMPT.format(agent_specs=agent_specs)
+
+        response = await self._llm_agent.arun(prompt)
+        langfuse.update_current_trace(
+            name="generate_profile_batch",
+            input=prompt,
+            output=response.content,
+            tags=["profile_generation", "batch"]
+        )
+
+        generated_profiles = {}
+        try:
+            parsed = self._parse_batch_response(response.content)
+        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            # Only an unusable answer is retried per agent; errors from the LLM
+            # call itself (rate limits, auth, ...) propagate to the caller
+            logger.warning(f"Could not parse batched profile response: {e}")
+        else:
+            for task_id in specs:
+                profile = parsed.get(task_id)
+                if isinstance(profile, str) and profile.strip():
+                    generated_profiles[task_id] = profile.strip()
+                    await self._cache_profile(self._profile_cache_key(**specs[task_id]), generated_profiles[task_id])
+
+        missing = [task_id for task_id in specs if task_id not in generated_profiles]
+        if missing:
+            logger.warning(f"Falling back to individual profile generation for: {', '.join(missing)}")
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    fallback_tasks = {task_id: tg.create_task(self.generate_profile(**specs[task_id])) for task_id in missing}
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0] from None
+            generated_profiles.update((task_id, task.result()) for task_id, task in fallback_tasks.items())
+
+        logger.info(f"Batch of {len(specs)} profiles generated successfully")
+        return generated_profiles
+
+    def _parse_batch_response(self, raw_text: str) -> Dict[str, Any]:
+        """Extract the JSON object of task id -> system prompt from a batch response."""
+        json_text = raw_text.strip()
+
+        if '```json' in json_text:
+            start = json_text.find('```json') + 7
+            end = json_text.find('```', start)
+            if end != -1:
+                json_text = json_text[start:end]
+        elif '```' in json_text:
+            parts = json_text.split('```')
+            if len(parts) >= 3:
+                json_text = parts[1]
+
+        start_idx = json_text.find('{')
+        end_idx = json_text.rfind('}')
+        if start_idx != -1 and end_idx > start_idx:
+            json_text = json_text[start_idx:end_idx + 1]
+
+        parsed = json.loads(json_text)
+        if not isinstance(parsed, dict):
+            raise ValueError("Batch response is not a JSON object")
+        return parsed
+
+    @observe()
+    async def generate_team_profile(self, task_description: str, team_config: dict) -> str:
+        """Generate system prompt for team coordination."""
+        # Build member descriptions
+        member_descriptions = []
+        for member in team_config["agents"]:
+            tools = ", ".join(member.get("tools", ["none"]))
+            member_descriptions.append(f"- {member['role']}: {member['description']} (Tools: {tools})")
+
+        members_text = "\n".join(member_descriptions)
+        collaboration_pattern = team_config.get("collaboration_pattern", "collaborate")
+
+        prompt = f"""Generate a system prompt for a team coordinator managing this task:
+
+Task: {task_description}
+Collaboration Pattern: {collaboration_pattern}
+
+Team Members:
+{members_text}
+
+The system prompt should:
+1. Define the coordinator's role in managing team collaboration
+2. Explain how to coordinate the {collaboration_pattern} pattern
+3. Specify how to delegate work to appropriate team members
+4. Be concise (1-2 paragraphs)
+
+Your response should be ONLY the system prompt text."""
+
+        response = await self._llm_agent.arun(prompt)
+        generated_profile = response.content.strip()
+
+        langfuse.update_current_trace(
+            name=f"generate_team_profile_{collaboration_pattern}",
+            input=prompt,
+            output=generated_profile,
+            tags=["profile_generation", "team"]
+        )
+
+        logger.info(f"Team profile generated for {collaboration_pattern} pattern")
+        return generated_profile
+    
+    def _profile_cache_key(self, agent_profile: AgentProfile, task_description: str, tools: List[str], dependencies: List[str] = None) -> Tuple:
+        """Build a hashable cache key from the model and the inputs of ``generate_profile``."""
+        return (
+            self._llm_agent.model.id,
+            agent_profile.task_type,
+            agent_profile.complexity,
+            agent_profile.output_format,
+            agent_profile.reasoning_style,
+            task_description,
+            tuple(sorted(tools or ())),
+            tuple(sorted(dependencies or ()))
+        )
+
+    async def _get_cached_profile(self, key: Tuple) -> Optional[str]:
+        """Return a cached profile and mark it as recently used, checking the disk cache on a miss."""
+        profile = self._profile_cache.get(key)
+        if profile is not None:
+            self._profile_cache.move_to_end(key)
+        elif cache_enabled():
+            profile = await asyncio.to_thread(cache_get, "profiles", cache_key(*key))
+            if profile is not None:
+                await self._cache_profile(key, profile, persist=False)
+        return profile
+
+    async def _cache_profile(self, key: Tuple, profile: str, persist: bool = True) -> None:
+        """Store a generated profile, evicting the least recently used entry when full."""
+        self._profile_cache[key] = profile
+        self._profile_cache.move_to_end(key)
+        if len(self._profile_cache) > self._profile_cache_size:
+            self._profile_cache.popitem(last=False)
+        if persist and cache_enabled():
+            await asyncio.to_thread(cache_put, "profiles", cache_key(*key), profile)
+
+    def _get_prompt_fields(self, agent_profile: AgentProfile, task_description: str, tools: List[str], dependencies: List[str] = None) -> Dict[str, str]:
+        """Collect the template fields describing a single agent."""
+        return {
+            "task_type": agent_profile.task_type,
+            "task_type_description": self._get_task_type_description(agent_profile.task_type),
+            "complexity": agent_profile.complexity,
+            "complexity_description": self._get_complexity_description(agent_profile.complexity),
+            "output_format": agent_profile.output_format,
+            "output_format_description": self._get_output_format_description(agent_profile.output_format),
+            "reasoning_style": agent_profile.reasoning_style,
+            "reasoning_style_description": self._get_reasoning_style_description(agent_profile.reasoning_style),
+            "task_description": task_description,
+            "tools_description": self._get_tool_descriptions(tools),
+            "dependency_context": self._get_dependency_context(dependencies, agent_profile.task_type)
+        }
+
+    def _get_task_type_description(self, task_type: str) -> str:
+        """Get description for task type."""
+        return _TASK_TYPE_DESCRIPTIONS.get(task_type, "General task execution")
+
+    def _get_complexity_description(self, complexity: str) -> str:
+        """Get description for complexity level."""
+        return _COMPLEXITY_DESCRIPTIONS.get(complexity, "Standard complexity")
+
+    def _get_output_format_description(self, output_format: str) -> str:
+        """Get description for output format."""
+        return _OUTPUT_FORMAT_DESCRIPTIONS.get(output_format, "Standard output")
+
+    def _get_reasoning_style_description(self, reasoning_style: str) -> str:
+        """Get description for reasoning style."""
+        return _REASONING_STYLE_DESCRIPTIONS.get(reasoning_style, "Standard reasoning")
+    
+    def _get_tool_descriptions(self, tools: List[str]) -> str:
+        """Get detailed descriptions for tools."""
+        return _describe_tools(tuple(tools)) if tools else "No tools available"
+
+    def _get_dependency_context(self, dependencies: List[str], task_type: str) -> str:
+        """Get context about dependencies."""
+        if not dependencies:
+            if task_type == "SEARCH":
+                return "DEPENDENCY CONTEXT: You are a starting node in the workflow. Your output will be used by downstream agents."
+            else:
+                return "DEPENDENCY CONTEXT: You are a starting node in the workflow."
+
+        dep_context = f"DEPENDENCY CONTEXT: You will receive input from {len(dependencies)} upstream task(s): {', '.join(dependencies)}."
+
+        if task_type == "SEARCH":
+            dep_context += " Use this context to inform your search strategy."
+        elif task_type == "THINK":
+            dep_context += " Analyze and process the provided information."
+        elif task_type == "AGGREGATE":
+            dep_context += " Synthesize all inputs into a comprehensive final output."
+        elif task_type == "ACT":
+            dep_context += " Use this context to inform your actions and file operations."
+
+        return dep_context
+
@@ -58,4 +58,34 @@ Generate a system prompt that:
 4. Provides guidance on reasoning approach and methodology
 5. Is concise but comprehensive (2-4 paragraphs)
 
-Your response should be ONLY the system prompt text, no additional commentary."""
\ No newline at end of file
+Your response should be ONLY the system prompt text, no additional commentary."""
+
+PROFILE_GENERATOR_BATCH_ITEM_PROMPT = """### AGENT: {task_id}
+- Your role: {task_type} ({task_type_description})
+- Complexity level: {complexity} ({complexity_description})
+- Expected output: {output_format} ({output_format_description})
+- Reasoning approach: {reasoning_style} ({reasoning_style_description})
+
+Task: {task_description}
+
+AVAILABLE TOOLS:
+{tools_description}
+
+{dependency_context}"""
+
+PROFILE_GENERATOR_BATCH_PROMPT = """You are generating system prompts for several AI agents operating within the same DAG (Directed Acyclic Graph) workflow system. Every agent is part of a coordinated multi-agent workflow.
+
+AGENTS:
+{agent_specs}
+
+SYSTEM PROMPT REQUIREMENTS:
+For EACH agent above, generate a system prompt that:
+1. Clearly defines the agent's role and capabilities
+2. Explains how to use the available tools effectively
+3. Specifies the expected output format and quality standards
+4. Provides guidance on reasoning approach and methodology
+5. Is concise but comprehensive (2-4 paragraphs)
+
+Your response should be ONLY a JSON object mapping every agent id to its system prompt text, for example:
+{{"agent_id_1": "system prompt text", "agent_id_2": "system prompt text"}}
+Include each agent id exactly once and no additional commentary."""
\ No newline at end of file
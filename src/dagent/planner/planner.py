@@ -1,29 +1,22 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.models.google import Gemini
-from agno.models.openai import OpenAILike
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Literal
 import json
 import os
-import asyncio
 from dotenv import load_dotenv
 from .prompts import PLANNER_SYSTEM_PROMPT, AVAILABLE_AGENT_PROFILES, EXAMPLE_JSON, AVAILABLE_TOOLS
 
 
 
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '..', '.env'))
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 model_id = os.getenv("MODEL_ID")
 base_url = os.getenv("BASE_URL")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
 # Import centralized tracing
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils import get_model
-from tracing import langfuse, observe
+from dagent.utils import get_model
+from dagent.tracing import langfuse, observe
 
 class AgentProfile(BaseModel):
     """Agent profile configuration with semantic fields."""
@@ -6,7 +6,7 @@ from .file_editor import FileEditorTools
 from .base import BaseAgnoTool
 import os
 from dotenv import load_dotenv
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '..', '.env'))
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
@@ -5,7 +5,7 @@ import logging
 from dotenv import load_dotenv
 
 # Load environment variables
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 
 # Reduce OpenLIT logging verbosity
 logging.getLogger("openlit").setLevel(logging.WARNING)
@@ -0,0 +1,2 @@
+from .model_factory import get_model
+from .cache import cache_enabled, cache_key, cache_get, cache_put
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Simple on-disk cache for generated plans and agent profiles.
+
+Entries are stored as JSON files under ~/.cache/dagent/<namespace>/<sha256>.json
+(override the root with DAGENT_CACHE_DIR). Caching is opt-in via DAGENT_CACHE=1.
+"""
+import os
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Optional
+import orjson
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.getenv("DAGENT_CACHE_DIR", Path.home() / ".cache" / "dagent"))
+
+
+def cache_enabled() -> bool:
+    """Check whether the on-disk cache is turned on."""
+    return os.getenv("DAGENT_CACHE") == "1"
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Build a stable SHA-256 cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values that determine the cached result
+
+    Returns:
+        str: Hex digest identifying the entry
+    """
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def cache_get(namespace: str, key: str) -> Optional[Any]:
+    """
+    Load a cached value.
+
+    Args:
+        namespace: Cache subdirectory, e.g. "plans" or "profiles"
+        key: Key from cache_key()
+
+    Returns:
+        The cached value, or None on a miss or unreadable entry
+    """
+    path = CACHE_DIR / namespace / f"{key}.json"
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+
+def cache_put(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a JSON-serializable value, replacing any previous entry atomically.
+
+    Args:
+        namespace: Cache subdirectory, e.g. "plans" or "profiles"
+        key: Key from cache_key()
+        value: Value to store
+    """
+    directory = CACHE_DIR / namespace
+    path = directory / f"{key}.json"
+    tmp_path = directory / f"{key}.{os.getpid()}.tmp"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps(value))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not write cache entry {path}: {e}")
\ No newline at end of file
@@ -1 +0,0 @@
-from .model_factory import get_model
\ No newline at end of file